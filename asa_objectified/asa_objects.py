@@ -1,7 +1,205 @@
 from ipaddress import IPv4Network
 from ipaddress import IPv4Address
+from collections import Counter
 from enum import Enum
+from enum import IntEnum
+from functools import lru_cache
 import ipaddress
+import sys
+
+# The parse and format caches below live for the whole process. When
+# full, _parse_ipv4_cached and _format_addr each retain about 1.5 MB and
+# _build_network about 150 KB. Call cache_clear() on them to release it.
+_PARSE_CACHE_SIZE = 8192
+_NETWORK_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=_NETWORK_CACHE_SIZE)
+def _build_network(addr: int, prefixlen: int) -> IPv4Network:
+    """Returns the IPv4Network for an integer address and prefix length.
+
+    Args:
+        addr (int): The network address as an unsigned 32 bit integer
+        prefixlen (int): The prefix length, from 0 to 32
+
+    Returns:
+        IPv4Network: The network
+    """
+    return IPv4Network((addr, prefixlen))
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _format_addr(addr: int) -> str:
+    """Returns the dotted-quad form of an integer address. Objects which
+    share an address also share the cached string.
+
+    Args:
+        addr (int): The address as an unsigned 32 bit integer
+
+    Returns:
+        str: The address, such as '10.1.1.1'
+    """
+    return f'{addr >> 24}.{addr >> 16 & 0xFF}.{addr >> 8 & 0xFF}.{addr & 0xFF}'
+
+
+_DIGITS = frozenset('0123456789')
+
+# Netmask for each prefix length, indexed by prefix length
+_NETMASK = tuple(
+    IPv4Network(f'0.0.0.0/{prefixlen}').netmask
+    for prefixlen in range(33)
+)
+_NETMASK_STR = tuple(str(netmask) for netmask in _NETMASK)
+_NETMASK_PREFIX = {netmask: prefixlen
+                   for prefixlen, netmask in enumerate(_NETMASK_STR)}
+
+# Counts of specs which could not take the fast path. Specs ipaddress
+# accepted are counted under 'slow_path', once per distinct spec since
+# _parse_ipv4 caches string specs, and show how well the fast path fits
+# a workload. Invalid specs are counted under 'rejected' each time.
+_parse_stats = Counter()
+
+# Keyword fragments shared by the CLI lines of every object. Interned so
+# that all generated lines are built from a single copy of each.
+_OBJ_NET = sys.intern('object network ')
+_OBJ_SVC = sys.intern('object service ')
+_SVC = sys.intern('service ')
+_SVC_ICMP = sys.intern(' service icmp ')
+_SOURCE = sys.intern(' source ')
+_DESTINATION = sys.intern(' destination ')
+
+
+def _parse_decimal(text: str, maximum: int) -> int:
+    """Parses one plain decimal field of an IPv4 spec.
+
+    Args:
+        text (str): The field to parse, such as an octet or a prefix length
+        maximum (int): The largest value permitted for the field
+
+    Raises:
+        ValueError: If the field is empty, too long, has a leading zero,
+            contains anything other than ASCII digits, or is too large.
+
+    Returns:
+        int: The value of the field
+    """
+    if (not 0 < len(text) <= 3
+            or not _DIGITS.issuperset(text)
+            or (text[0] == '0' and len(text) > 1)):
+        raise ValueError(f'Not a plain decimal field: {text!r}')
+
+    value = int(text)
+    if value > maximum:
+        raise ValueError(f'Field is out of range: {text!r}')
+    return value
+
+
+def _parse_dotted_quad(address: str) -> int:
+    """Parses a plain 'a.b.c.d' address into an int.
+
+    Args:
+        address (str): The address to parse
+
+    Raises:
+        ValueError: If the address is not four plain decimal octets.
+
+    Returns:
+        int: The address as an unsigned 32 bit integer
+    """
+    # Let int() accumulate the digits of all four octets, then reject
+    # anything it was more lenient about than ipaddress (signs, spaces,
+    # underscores, leading zeros) by checking the address round-trips.
+    a, b, c, d = map(int, address.split('.'))
+    if (a | b | c | d) & ~0xFF or f'{a}.{b}.{c}.{d}' != address:
+        raise ValueError(f'Not a plain dotted-quad address: {address!r}')
+
+    return a << 24 | b << 16 | c << 8 | d
+
+
+def _fast_parse_ipv4(spec: str) -> tuple:
+    """Parses an IPv4 spec in the common 'a.b.c.d', 'a.b.c.d/prefix' or
+    'a.b.c.d/netmask' form directly into integers, without building any
+    ipaddress objects.
+
+    Args:
+        spec (str): The address or network to parse
+
+    Raises:
+        ValueError: If the spec is not in a common form, or has host
+            bits set. Other forms (such as hostmask notation) are left to
+            ipaddress, which will either accept or properly reject them.
+
+    Returns:
+        tuple: The network address and prefix length, as ints
+    """
+    if type(spec) is not str:
+        raise ValueError('Spec is not a string')
+
+    # Cheap checks on the shape of the spec before parsing any digits
+    address, slash, prefix = spec.partition('/')
+    if address.count('.') != 3:
+        raise ValueError(f'Expected 4 octets in spec: {spec!r}')
+
+    addr = _parse_dotted_quad(address)
+
+    # A bare host has no prefix to parse and no host bits to check
+    if not slash:
+        return addr, 32
+
+    prefixlen = _NETMASK_PREFIX.get(prefix)
+    if prefixlen is None:
+        prefixlen = _parse_decimal(prefix, 32)
+
+    if addr & (0xFFFFFFFF >> prefixlen):
+        raise ValueError(f'Spec has host bits set: {spec!r}')
+
+    return addr, prefixlen
+
+
+def _parse_ipv4_uncached(spec) -> tuple:
+    """Parses an IPv4 address or network into integers, using the fast
+    parser where possible and falling back to ipaddress otherwise.
+
+    Args:
+        spec (any): The address or network, as accepted by IPv4Network
+
+    Returns:
+        tuple: The network address and prefix length, as ints
+    """
+    try:
+        return _fast_parse_ipv4(spec)
+    except ValueError:
+        pass
+
+    try:
+        network = IPv4Network(spec)
+    except ValueError:
+        _parse_stats['rejected'] += 1
+        raise
+
+    _parse_stats['slow_path'] += 1
+    return int(network.network_address), network.prefixlen
+
+
+_parse_ipv4_cached = lru_cache(maxsize=_PARSE_CACHE_SIZE)(_parse_ipv4_uncached)
+
+
+def _parse_ipv4(spec) -> tuple:
+    """Parses an IPv4 address or network into integers. String specs
+    are cached, so that addresses and prefixes which recur across a large
+    configuration are only parsed once. Anything else, such as an int,
+    an ipaddress object or an invalid unhashable value, goes straight to
+    the uncached parser and so raises the same errors as ipaddress.
+
+    Args:
+        spec (any): The address or network, as accepted by IPv4Network
+
+    Returns:
+        tuple: The network address and prefix length, as ints
+    """
+    if type(spec) is str:
+        return _parse_ipv4_cached(spec)
+    return _parse_ipv4_uncached(spec)
 
 
 class NetworkObject(object):
@@ -9,12 +207,27 @@ class NetworkObject(object):
     or range object.
     """
 
-    class ObjectType(Enum):
+    class ObjectType(IntEnum):
         RANGE = 1
         HOST = 2
         NETWORK = 3
         FQDN = 4
 
+    __slots__ = (
+        '_addr',
+        '_prefix',
+        '_end_addr',
+        '_end_prefix',
+        '_addr_str',
+        '_end_addr_str',
+        '_type',
+        '_fqdn',
+        '_cached_attrs',
+        '_cached_name',
+        '_name',
+        'description',
+    )
+
     def __init__(
         self,
         ob_type=None,
@@ -29,6 +242,16 @@ class NetworkObject(object):
         self.description = description
         self.name = name
         self.type = ob_type
+        self.fqdn = None
+
+        # Addresses are stored as integers, alongside their dotted-quad
+        # strings for rendering. See the ip and end_ip properties.
+        self._addr = None
+        self._prefix = None
+        self._end_addr = None
+        self._end_prefix = None
+        self._addr_str = None
+        self._end_addr_str = None
 
         # Initialize the object
         if not self.type:
@@ -59,8 +282,8 @@ class NetworkObject(object):
             ip (str): The starting address for the range
             end_ip (str): The ending address for the range
         """
-        self.ip = IPv4Network(ip)
-        self.end_ip = IPv4Network(end_ip)
+        self.ip = ip
+        self.end_ip = end_ip
         self.type = NetworkObject.ObjectType.RANGE
         if not self.name:
             self.generate_name()
@@ -86,16 +309,26 @@ class NetworkObject(object):
         """
         # Convert the supplied variables into an object
         if netmask:
-            ip = IPv4Network(f'{ip}/{netmask}')
+            spec = f'{ip}/{netmask}'
         elif CIDR:
-            ip = IPv4Network(f'{ip}/{CIDR}')
+            spec = f'{ip}/{CIDR}'
         else:
-            ip = IPv4Network(ip)
+            spec = ip
 
-        self.ip = ip
+        self._init_host_or_net_from_int(*_parse_ipv4(spec))
+
+    def _init_host_or_net_from_int(self, addr: int, prefixlen: int):
+        """Sets the ip, name, and object type parameters for a Host or
+        Network type object from an already parsed address.
+
+        Args:
+            addr (int): The network address of the object
+            prefixlen (int): The prefix length of the object
+        """
+        self._set_addr(addr, prefixlen)
 
         # Check if it's a /32
-        if ip.prefixlen == 32:
+        if prefixlen == 32:
             self.type = NetworkObject.ObjectType.HOST
         else:
             self.type = NetworkObject.ObjectType.NETWORK
@@ -104,39 +337,80 @@ class NetworkObject(object):
         if not self.name:
             self.generate_name()
 
-        return self.ip
+    def _check_addresses(self):
+        """Verifies that the addresses the object type needs are set.
+        Only FQDN objects may go without an address.
+
+        Raises:
+            ValueError: If the address, or the end address of a range,
+                is not set.
+        """
+        if self.type == NetworkObject.ObjectType.FQDN:
+            return
+
+        if self._addr is None:
+            raise ValueError('No address set for network object.')
+
+        if (self.type == NetworkObject.ObjectType.RANGE
+                and self._end_addr is None):
+            raise ValueError('No end address set for range object.')
+
+    @classmethod
+    def from_strings(cls, specs) -> list:
+        """Creates a Host or Network type object for each IP in a list,
+        such as a column of addresses loaded from a CSV file. Specs
+        which recur are parsed once, through the cache in _parse_ipv4.
+
+        Args:
+            specs (iterable): The IPs of the objects, in any form accepted
+                by the ip argument of init_host_or_net_object.
+
+        Returns:
+            list: The new NetworkObjects, in the same order as the specs
+        """
+        objects = []
+        for spec in specs:
+            ob = cls()
+            ob._init_host_or_net_from_int(*_parse_ipv4(spec))
+            objects.append(ob)
+
+        return objects
 
     def generate_name(self) -> str:
         """Generates an object name based on the current attributes
         of the object.
 
         Raises:
-            ValueError: Raised when NetworkObject not set to type
+            ValueError: Raised when NetworkObject not set to type, or
+                when an address it needs is not set
 
         Returns:
             str: The generated object name
         """
-
         if self.type == NetworkObject.ObjectType.HOST:
-            self.name = f'HOST_{self.ip.network_address}'
+            name = f'HOST_{self._addr_str}'
         elif self.type == NetworkObject.ObjectType.NETWORK:
-            self.name = f'NET_{self.ip.network_address}_{self.ip.prefixlen}'
+            name = f'NET_{self._addr_str}_{self._prefix}'
         elif self.type == NetworkObject.ObjectType.RANGE:
-            self.name = f'RANGE_{self.ip.network_address}-{self.end_ip.network_address}'
+            name = f'RANGE_{self._addr_str}-{self._end_addr_str}'
         elif self.type == NetworkObject.ObjectType.FQDN:
-            self.name = f'FQDN_{self.fqdn}'
+            name = f'FQDN_{self.fqdn}'
         else:
             raise ValueError(
                 'NetworkObject not set to type when generating name.')
 
-        return self.name
+        # Only check the addresses once the type is known to be valid
+        self._check_addresses()
+
+        self._cached_name = name
+        return name
 
     def cli_definition(self) -> str:
         """Returns the single line CLI command which creates the object.
         """
         if not self.name:
             self.generate_name()
-        return f'object network {self.name}'
+        return _OBJ_NET + self.name
 
     def cli_attributes(self) -> str:
         """Generates the CLI line which specifies the attributes of the 
@@ -144,30 +418,36 @@ class NetworkObject(object):
         the name of the object).
 
         Raises:
-            ValueError: If the object type is incorrectly set.
+            ValueError: If the object type is incorrectly set, or an
+                address it needs is not set.
 
         Returns:
             str: The CLI commands
         """
 
+        # Reuse the line from a previous call, if nothing has changed since
+        if self._cached_attrs is not None:
+            return self._cached_attrs
+
         # Object details
         if not self.type:
             raise ValueError('No value set for object type.')
 
-        elif self.type == NetworkObject.ObjectType.HOST:
-            return f' host {self.ip.network_address}'
-
-        elif self.type == NetworkObject.ObjectType.NETWORK:
-            return f' subnet {self.ip.network_address} {self.ip.netmask}'
-
-        elif self.type == NetworkObject.ObjectType.RANGE:
-            return f' range {self.ip.network_address} {self.end_ip.network_address}'
+        try:
+            template = _CLI_ATTR_TMPL[self.type]
+        except KeyError:
+            raise ValueError('Invalid value set for object type.') from None
 
-        elif self.type == NetworkObject.ObjectType.FQDN:
-            return f' fqdn {self.fqdn}'
+        self._check_addresses()
+        attrs = template.format(
+            addr=self._addr_str,
+            mask=None if self._prefix is None else _NETMASK_STR[self._prefix],
+            end=self._end_addr_str,
+            fqdn=self.fqdn,
+        )
 
-        else:
-            raise ValueError('Invalid value set for object type.')
+        self._cached_attrs = attrs
+        return attrs
 
     def cli_full(self) -> list:
         """Create the ASA-style CLI commands to create this 
@@ -179,7 +459,7 @@ class NetworkObject(object):
         """
 
         # Definition and attributes
-        rule_text = [self.cli_definition, self.cli_attributes]
+        rule_text = [self.cli_definition(), self.cli_attributes()]
 
         # Optional description
         if self.description:
@@ -191,24 +471,134 @@ class NetworkObject(object):
 
     def __str__(self):
         try:
-            return '\n'.join(self.cli_full)
+            # Rendered in one pass rather than by joining cli_full()
+            description = (f'\n description {self.description}'
+                           if self.description else '')
+            return (f'{self.cli_definition()}\n{self.cli_attributes()}'
+                    f'{description}\n!')
         except Exception:
             return "Unconfigured Network Object"
 
+    def _clear_cache(self):
+        """Discards the generated name and CLI attributes, so that they
+        are rebuilt from the current attributes when next needed.
+        """
+        self._cached_name = None
+        self._cached_attrs = None
+
+    @property
+    def name(self) -> str:
+        """Returns the object name, or generates it if no name was
+        previously assigned. Returns None for an object with no type.
+
+        Returns:
+            str: The name of the object.
+        """
+        if self._name:
+            return self._name
+        elif self._cached_name:
+            return self._cached_name
+        elif not self.type:
+            return None
+        else:
+            return self.generate_name()
+
+    @name.setter
+    def name(self, name: str):
+        self._name = name
+
+    @property
+    def type(self) -> ObjectType:
+        return self._type
+
+    @type.setter
+    def type(self, ob_type: ObjectType):
+        self._clear_cache()
+        self._type = ob_type
+
+    @property
+    def fqdn(self) -> str:
+        return self._fqdn
+
+    @fqdn.setter
+    def fqdn(self, fqdn: str):
+        self._clear_cache()
+        self._fqdn = fqdn
+
+    @property
+    def ip(self) -> IPv4Network:
+        """Returns the address of the object as an IPv4Network. This is
+        built on demand from the stored integer address and prefix.
+        """
+        if self._addr is None:
+            return None
+        return _build_network(self._addr, self._prefix)
+
+    @ip.setter
+    def ip(self, ip):
+        if ip is None:
+            self._set_addr(None, None)
+        else:
+            self._set_addr(*_parse_ipv4(ip))
+
+    def _set_addr(self, addr: int, prefixlen: int):
+        """Stores an already parsed address and prefix length.
+        """
+        self._clear_cache()
+        self._addr = addr
+        self._prefix = prefixlen
+        self._addr_str = None if addr is None else _format_addr(addr)
+
+    @property
+    def end_ip(self) -> IPv4Network:
+        """Returns the end address of a range object as an IPv4Network.
+        """
+        if self._end_addr is None:
+            return None
+        return _build_network(self._end_addr, self._end_prefix)
+
+    @end_ip.setter
+    def end_ip(self, end_ip):
+        self._clear_cache()
+        if end_ip is None:
+            self._end_addr = self._end_prefix = None
+            self._end_addr_str = None
+        else:
+            self._end_addr, self._end_prefix = _parse_ipv4(end_ip)
+            self._end_addr_str = _format_addr(self._end_addr)
+
     @property
     def netmask(self):
         """Returns the netmask of the object.
         """
-        return self.ip.netmask
+        if self._prefix is None:
+            return None
+        return _NETMASK[self._prefix]
+
+
+# CLI attribute line for each network object type
+_CLI_ATTR_TMPL = {
+    NetworkObject.ObjectType.HOST: ' host {addr}',
+    NetworkObject.ObjectType.NETWORK: ' subnet {addr} {mask}',
+    NetworkObject.ObjectType.RANGE: ' range {addr} {end}',
+    NetworkObject.ObjectType.FQDN: ' fqdn {fqdn}',
+}
 
 
 class _ServiceObject(object):
 
+    __slots__ = (
+        '_name',
+        '_cached_name',
+        '_cached_attrs',
+        '_port_selecter_type',
+    )
+
     def __init__(self):
         pass
 
     # Object types
-    class PortSelecterType(Enum):
+    class PortSelecterType(str, Enum):
         SINGLE = 'eq'
         RANGE = 'range'
         LESS_THAN = 'lt'
@@ -224,9 +614,16 @@ class _ServiceObject(object):
         """
         raise NotImplementedError
 
+    def _clear_cache(self):
+        """Discards the generated name and CLI attributes, so that they
+        are rebuilt from the current attributes when next needed.
+        """
+        self._cached_name = None
+        self._cached_attrs = None
+
     @property
     def name(self) -> str:
-        """Returns the object name, or sets it if no name was 
+        """Returns the object name, or generates it if no name was 
         previously assigned.
 
         Returns:
@@ -234,6 +631,8 @@ class _ServiceObject(object):
         """
         if self._name:
             return self._name
+        elif self._cached_name:
+            return self._cached_name
         else:
             return self.generate_name()
 
@@ -247,7 +646,7 @@ class _ServiceObject(object):
 
     @port_selecter_type.setter
     def port_selecter_type(self, value: PortSelecterType):
-        assert value in self.PortSelecterType, "Type is not valid"
+        assert isinstance(value, self.PortSelecterType), "Type is not valid"
         self._port_selecter_type = value
 
     def cli_definition(self) -> str:
@@ -256,7 +655,7 @@ class _ServiceObject(object):
         # Sets the name if no name exists yet
         if not self.name:
             self.generate_name()
-        return f'object service {self.name}'
+        return _OBJ_SVC + self.name
 
     def cli_attributes(self) -> str:
         """Generates the CLI line which specifies the attributes of the 
@@ -279,12 +678,48 @@ class _ServiceObject(object):
         return [self.cli_definition(), self.cli_attributes(), '!']
 
 
+# CLI keyword for each port selecter type, as used in names and in commands
+_SEL_UPPER = {m: m.value.upper() for m in _ServiceObject.PortSelecterType}
+_SEL_VAL = {m: m.value for m in _ServiceObject.PortSelecterType}
+
+
+def _check_port(port: int) -> bool:
+    """Verifies that a port is a valid value
+
+    Args:
+        port (int): The port to check
+
+    Raises:
+        ValueError: If a value is not within 0 to 65535
+
+    Returns:
+        Bool: True if the value is a valid port
+    """
+
+    if port is None:
+        return False
+
+    # Any bit set above the low 16 means the port is out of range
+    if (port if type(port) is int else int(port)) & ~0xFFFF:
+        raise ValueError('Port value is out of range')
+    return True
+
+
 class _TcpOrUdpObject(_ServiceObject):
     """A class representing Cisco ASA-style TCP or UDP objects. 
     This class is not designed to be called directly. It must be 
     inherited by the TcpObject or UdpObject classes.
     """
 
+    __slots__ = (
+        '_source_port_selecter_type',
+        '_source_port',
+        '_source_end_port',
+        '_dest_port_selecter_type',
+        '_dest_port',
+        '_dest_end_port',
+    )
+
     def __init__(self,
                  source_port_selecter_type=None,
                  source_port=None,  # Single port, or start port in range
@@ -302,26 +737,6 @@ class _TcpOrUdpObject(_ServiceObject):
         self.dest_port = dest_port
         self.dest_end_port = dest_end_port
 
-    def _check_port(self, port: int) -> bool:
-        """Verifies that a port is a valid value
-
-        Args:
-            port (int): The port to check
-
-        Raises:
-            ValueError: If a value is not within 0 to 65535
-
-        Returns:
-            Bool: True if the value is a valid port
-        """
-
-        if port == None:
-            return False
-        elif not (0 <= int(port) <= 65535):
-            raise ValueError('Port value is out of range')
-        else:
-            return True
-
     def generate_name(self) -> str:
         """Generates an object name based on the current attributes
         of the object.
@@ -329,24 +744,47 @@ class _TcpOrUdpObject(_ServiceObject):
         Returns:
             str: The generated object name
         """
-        name = f'SVC_{self._OBJECT_TYPE.upper()}'
-        if self.source_port_selecter_type == None:
+        parts = [f'SVC_{self._OBJECT_TYPE_UP}']
+        if self.source_port_selecter_type is None:
             pass
         elif self.source_port_selecter_type == self.PortSelecterType.RANGE:
-            name += f'_SRC_RANGE_{self.source_port}-{self.source_end_port}'
+            parts.append(f'_SRC_RANGE_{self.source_port}-{self.source_end_port}')
         else:
-            name += f'_SRC_{self.source_port_selecter_type.value.upper()}_{self.source_port}'
+            parts.append(f'_SRC_{_SEL_UPPER[self.source_port_selecter_type]}_{self.source_port}')
 
-        if self.dest_port_selecter_type == None:
+        if self.dest_port_selecter_type is None:
             pass
         elif self.dest_port_selecter_type == self.PortSelecterType.RANGE:
-            name += f'_DEST_RANGE_{self.dest_port}-{self.dest_end_port}'
+            parts.append(f'_DEST_RANGE_{self.dest_port}-{self.dest_end_port}')
         else:
-            name += f'_DEST_{self.dest_port_selecter_type.value.upper()}_{self.dest_port}'
+            parts.append(f'_DEST_{_SEL_UPPER[self.dest_port_selecter_type]}_{self.dest_port}')
 
-        self._name = name
+        name = ''.join(parts)
+        self._cached_name = name
         return name
 
+    @property
+    def source_port_selecter_type(self) -> _ServiceObject.PortSelecterType:
+        return self._source_port_selecter_type
+
+    @source_port_selecter_type.setter
+    def source_port_selecter_type(self, value: _ServiceObject.PortSelecterType):
+        assert ((value is None) or
+                isinstance(value, _ServiceObject.PortSelecterType)), "Type is not valid"
+        self._clear_cache()
+        self._source_port_selecter_type = value
+
+    @property
+    def dest_port_selecter_type(self) -> _ServiceObject.PortSelecterType:
+        return self._dest_port_selecter_type
+
+    @dest_port_selecter_type.setter
+    def dest_port_selecter_type(self, value: _ServiceObject.PortSelecterType):
+        assert ((value is None) or
+                isinstance(value, _ServiceObject.PortSelecterType)), "Type is not valid"
+        self._clear_cache()
+        self._dest_port_selecter_type = value
+
     # Set the source port with some basic error checking
     @property
     def source_port(self):
@@ -354,7 +792,8 @@ class _TcpOrUdpObject(_ServiceObject):
 
     @source_port.setter
     def source_port(self, port: int):
-        self._check_port(port)
+        _check_port(port)
+        self._clear_cache()
         self._source_port = port
 
     # Set the source end port with some basic error checking
@@ -364,7 +803,8 @@ class _TcpOrUdpObject(_ServiceObject):
 
     @source_end_port.setter
     def source_end_port(self, port: int):
-        self._check_port(port)
+        _check_port(port)
+        self._clear_cache()
         self._source_end_port = port
 
     # Set the destination port with some basic error checking
@@ -374,7 +814,8 @@ class _TcpOrUdpObject(_ServiceObject):
 
     @dest_port.setter
     def dest_port(self, port: int):
-        self._check_port(port)
+        _check_port(port)
+        self._clear_cache()
         self._dest_port = port
 
     # Set the destination end port with some basic error checking
@@ -382,9 +823,10 @@ class _TcpOrUdpObject(_ServiceObject):
     def dest_end_port(self):
         return self._dest_end_port
 
-    @dest_port.setter
+    @dest_end_port.setter
     def dest_end_port(self, port: int):
-        self._check_port(port)
+        _check_port(port)
+        self._clear_cache()
         self._dest_end_port = port
 
     def cli_attributes(self) -> str:
@@ -396,41 +838,103 @@ class _TcpOrUdpObject(_ServiceObject):
             str: The CLI commands
         """
 
-        # Error checking to make sure the port selector types are valid
-        assert ((not self.source_port_selecter_type) or
-                (self.source_port_selecter_type in _ServiceObject.PortSelecterType))
-        assert ((not self.dest_port_selecter_type) or
-                (self.dest_port_selecter_type in _ServiceObject.PortSelecterType))
+        # Reuse the line from a previous call, if nothing has changed since
+        if self._cached_attrs is not None:
+            return self._cached_attrs
 
         # Check errors and set the source attribute
         if not self.source_port_selecter_type:
             source = ''
         elif self.source_port_selecter_type == _ServiceObject.PortSelecterType.RANGE:
             assert self.source_port and self.source_end_port, 'Range starting or ending port not defined'
-            source = f' source {self.source_port_selecter_type.value} {self.source_port} {self.source_end_port}'
+            source = f'{_SOURCE}{_SEL_VAL[self.source_port_selecter_type]} {self.source_port} {self.source_end_port}'
         else:
             assert self.source_port, 'Source port not defined'
-            source = f' source {self.source_port_selecter_type.value} {self.source_port}'
+            source = f'{_SOURCE}{_SEL_VAL[self.source_port_selecter_type]} {self.source_port}'
 
         # Check errors and set the destination string
         if not self.dest_port_selecter_type:
             dest = ''
         elif self.dest_port_selecter_type == _ServiceObject.PortSelecterType.RANGE:
             assert self.dest_port and self.dest_end_port, 'Range starting or ending port not defined'
-            dest = f' source {self.dest_port_selecter_type.value} {self.dest_port} {self.dest_end_port}'
+            dest = f'{_DESTINATION}{_SEL_VAL[self.dest_port_selecter_type]} {self.dest_port} {self.dest_end_port}'
         else:
             assert self.dest_port, 'Destination port not defined'
-            dest = f' destination {self.dest_port_selecter_type.value} {self.dest_port}'
+            dest = f'{_DESTINATION}{_SEL_VAL[self.dest_port_selecter_type]} {self.dest_port}'
 
-        return f'service {self._OBJECT_TYPE}{source}{dest}'
+        self._cached_attrs = f'{_SVC}{self._OBJECT_TYPE}{source}{dest}'
+        return self._cached_attrs
 
 
 class TcpObject(_TcpOrUdpObject):
+    __slots__ = ()
     _OBJECT_TYPE = 'tcp'
+    _OBJECT_TYPE_UP = 'TCP'
 
 
 class UdpObject(_TcpOrUdpObject):
+    __slots__ = ()
     _OBJECT_TYPE = 'udp'
+    _OBJECT_TYPE_UP = 'UDP'
+
+
+def _verify_icmp_code(value: int,
+                      raise_error: bool = True
+                      ) -> bool:
+    """Verifies that a given ICMP code is between 1 and 255.
+
+    Args:
+        value (int): The ICMP code to validate.
+        raise_error (bool): Raises error on failed validation if True.
+
+    Raises:
+        ValueError: If the code is invalid.
+
+    Returns:
+        bool: True if the ICMP code is valid.
+    """
+
+    code = value if type(value) is int else int(value)
+    if code and not code & ~0xFF:
+        return True
+    else:
+        if raise_error:
+            raise ValueError('The given ICMP code is invalid')
+        return False
+
+
+def _verify_icmp_type(value: any,
+                      raise_error: bool = True
+                      ) -> bool:
+    """Verifies that a given ICMP type is either a str or an int
+    between 0 and 255.
+
+    Args:
+        value (any): The ICMP type to validate, either as a str or int.
+        raise_error (bool): Raises error on failed validation if True.
+
+    Raises:
+        ValueError: If the code is invalid.
+
+    Returns:
+        bool: True if the ICMP type is valid.
+    """
+    # Check if it is a string. Really we should verify this against all
+    # possible ICMP type values, but I don't have that list right now.
+    if (isinstance(value, str) and not value.isnumeric()):
+        return True
+
+    # Check to make sure the type was set at all
+    elif (not value):
+        raise ValueError('ICMP Type not set')
+
+    # Verify that it is a value between 0 and 255
+    if not (value if type(value) is int else int(value)) & ~0xFF:
+        return True
+    else:
+        if raise_error:
+            raise ValueError('The given ICMP type is invalid')
+        return False
 
 
 class IcmpObject(_ServiceObject):
@@ -440,6 +944,11 @@ class IcmpObject(_ServiceObject):
     device.
     """
 
+    __slots__ = (
+        '_icmp_code',
+        '_icmp_type',
+    )
+
     def __init__(self,
                  name=None,
                  icmp_type=None,
@@ -462,8 +971,8 @@ class IcmpObject(_ServiceObject):
         if self.icmp_code:
             name += '_CODE_' + str(self.icmp_code)
 
-        self.name = name.upper()
-        return self.name
+        self._cached_name = name.upper()
+        return self._cached_name
 
     @property
     def icmp_code(self) -> int:
@@ -478,12 +987,14 @@ class IcmpObject(_ServiceObject):
             value (int): The ICMP code to validate. Also accepts
                 None.
         """
+        self._clear_cache()
+
         # Permit this value to be unset.
-        if value == None:
+        if value is None:
             self._icmp_code = None
             return True
 
-        if self._verify_icmp_code(value):
+        if _verify_icmp_code(value):
             self._icmp_code = value
             return True
         else:
@@ -505,75 +1016,19 @@ class IcmpObject(_ServiceObject):
         Raises:
             ValueError: If the code is invalid.
         """
+        self._clear_cache()
+
         # Permit this value to be unset.
-        if value == None:
+        if value is None:
             self._icmp_type = None
             return True
 
-        if self._verify_icmp_type(value):
+        if _verify_icmp_type(value):
             self._icmp_type = value
             return True
         else:
             return False
 
-    def _verify_icmp_code(self,
-                          value: int,
-                          raise_error: bool = True
-                          ) -> bool:
-        """Verifies that a given ICMP code is between 1 and 255.
-
-        Args:
-            value (int): The ICMP code to validate.
-            raise_error (bool): Raises error on failed validation if True.
-
-        Raises:
-            ValueError: If the code is invalid.
-
-        Returns:
-            bool: True if the ICMP code is valid.
-        """
-
-        if (1 <= int(value) <= 255):
-            return True
-        else:
-            if raise_error:
-                raise ValueError('The given ICMP code is invalid')
-            return False
-
-    def _verify_icmp_type(self,
-                          value: any,
-                          raise_error: bool = True
-                          ) -> bool:
-        """Verifies that a given ICMP type is either a str or an int
-        between 0 and 255.
-
-        Args:
-            value (any): The ICMP type to validate, either as a str or int.
-            raise_error (bool): Raises error on failed validation if True.
-
-        Raises:
-            ValueError: If the code is invalid.
-
-        Returns:
-            bool: True if the ICMP type is valid.
-        """
-        # Check if it is a string. Really we should verify this against all
-        # possible ICMP type values, but I don't have that list right now.
-        if (isinstance(value, str) and not value.isnumeric()):
-            return True
-
-        # Check to make sure the type was set at all
-        elif (not value):
-            raise ValueError('ICMP Type not set')
-
-        # Verify that it is a value between 0 and 255
-        if (0 <= int(value) <= 255):
-            return True
-        else:
-            if raise_error:
-                raise ValueError('The given ICMP type is invalid')
-            return False
-
     def cli_definition(self):
         return super().cli_definition()
 
@@ -585,13 +1040,18 @@ class IcmpObject(_ServiceObject):
         Returns:
             str: The CLI command
         """
-        self._verify_icmp_type(self.icmp_type)
-        self._verify_icmp_code(self._icmp_code)
+        # Reuse the line from a previous call, if nothing has changed since
+        if self._cached_attrs is not None:
+            return self._cached_attrs
+
+        _verify_icmp_type(self.icmp_type)
+        _verify_icmp_code(self._icmp_code)
 
-        c = f' service icmp {self.icmp_type}'
+        c = _SVC_ICMP + str(self.icmp_type)
         if self.icmp_code:
             c += ' ' + str(self.icmp_code)
 
+        self._cached_attrs = c
         return c
 
     def cli_full(self):
@@ -599,6 +1059,8 @@ class IcmpObject(_ServiceObject):
 
 
 class ProtocolObject(_ServiceObject):
+    __slots__ = ()
+
     def __init__(self):
         raise NotImplementedError
 
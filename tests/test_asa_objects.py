@@ -10,6 +10,7 @@ from asa_objectified import IcmpObject
 from asa_objectified import TcpObject
 from asa_objectified import UdpObject
 from asa_objectified import ProtocolObject
+from asa_objectified import asa_objects
 
 def test_icmp_object_creation():
     i= IcmpObject(
@@ -31,4 +32,192 @@ def test_xfail_incorrect_attributes():
         icmp_type='echo',
         icmp_code=40,
     )
-    i.cli_full()
\ No newline at end of file
+    i.cli_full()
+
+def test_network_object_notations():
+    for kwargs in (
+        dict(ip='10.1.1.0/24'),
+        dict(ip='10.1.1.0', CIDR=24),
+        dict(ip='10.1.1.0', netmask='255.255.255.0'),
+        dict(ip='10.1.1.0/255.255.255.0'),
+    ):
+        n = NetworkObject(ob_type=NetworkObject.ObjectType.NETWORK, **kwargs)
+        assert n.name == 'NET_10.1.1.0_24'
+        assert n.cli_attributes() == ' subnet 10.1.1.0 255.255.255.0'
+
+    with pytest.raises(ValueError):
+        NetworkObject(ob_type=NetworkObject.ObjectType.NETWORK, ip='10.1.1.5/24')
+    with pytest.raises(ValueError):
+        NetworkObject(ob_type=NetworkObject.ObjectType.HOST, ip=['10.1.1.1'])
+
+
+def test_network_object_cli_full():
+    n = NetworkObject(
+        ob_type=NetworkObject.ObjectType.HOST,
+        ip='10.1.1.1',
+        description='Web server',
+    )
+
+    assert n.cli_full() == [
+        'object network HOST_10.1.1.1',
+        ' host 10.1.1.1',
+        ' description Web server',
+        '!',
+    ]
+    assert str(n) == '\n'.join(n.cli_full())
+    assert str(NetworkObject()) == 'Unconfigured Network Object'
+
+
+def test_network_objects_from_strings():
+    objects = NetworkObject.from_strings(
+        ['10.1.1.1', '10.2.0.0/16', '10.1.1.1', '10.3.0.0/255.255.0.0'])
+
+    assert [o.name for o in objects] == [
+        'HOST_10.1.1.1',
+        'NET_10.2.0.0_16',
+        'HOST_10.1.1.1',
+        'NET_10.3.0.0_16',
+    ]
+    assert objects[0].type == NetworkObject.ObjectType.HOST
+    assert objects[1].cli_attributes() == ' subnet 10.2.0.0 255.255.0.0'
+
+
+def test_tcp_object_dest_range():
+    t = TcpObject(
+        dest_port_selecter_type=TcpObject.PortSelecterType.RANGE,
+        dest_port=8000,
+        dest_end_port=8080,
+    )
+
+    assert t.dest_port == 8000
+    assert t.dest_end_port == 8080
+    assert t.name == 'SVC_TCP_DEST_RANGE_8000-8080'
+    assert t.cli_attributes() == 'service tcp destination range 8000 8080'
+
+    t.dest_end_port = 8443
+    assert t.name == 'SVC_TCP_DEST_RANGE_8000-8443'
+
+
+def test_range_object_requires_end_ip():
+    r = NetworkObject(
+        ob_type=NetworkObject.ObjectType.RANGE,
+        ip='10.0.0.1',
+        end_ip='10.0.0.9',
+    )
+    assert r.cli_attributes() == ' range 10.0.0.1 10.0.0.9'
+
+    with pytest.raises(ValueError):
+        NetworkObject(ob_type=NetworkObject.ObjectType.RANGE, ip='10.0.0.1')
+
+    r.end_ip = None
+    with pytest.raises(ValueError):
+        r.cli_attributes()
+    assert str(r) == 'Unconfigured Network Object'
+
+
+def test_untyped_network_object_name_error():
+    with pytest.raises(ValueError, match='not set to type'):
+        NetworkObject().generate_name()
+    with pytest.raises(ValueError, match='not set to type'):
+        NetworkObject().cli_definition()
+
+
+def test_network_object_cache_invalidation():
+    n = NetworkObject(ob_type=NetworkObject.ObjectType.HOST, ip='10.1.1.1')
+    assert n.name == 'HOST_10.1.1.1'
+    assert n.cli_attributes() == ' host 10.1.1.1'
+
+    n.ip = '10.1.1.2'
+    assert n.cli_full()[:2] == ['object network HOST_10.1.1.2',
+                                ' host 10.1.1.2']
+
+    n.type = NetworkObject.ObjectType.RANGE
+    n.end_ip = '10.1.1.9'
+    assert n.name == 'RANGE_10.1.1.2-10.1.1.9'
+    assert n.cli_attributes() == ' range 10.1.1.2 10.1.1.9'
+
+    n.end_ip = '10.1.1.20'
+    assert n.name == 'RANGE_10.1.1.2-10.1.1.20'
+    assert n.cli_attributes() == ' range 10.1.1.2 10.1.1.20'
+
+    n.type = NetworkObject.ObjectType.FQDN
+    n.fqdn = 'a.example.com'
+    assert n.name == 'FQDN_a.example.com'
+    assert n.cli_attributes() == ' fqdn a.example.com'
+
+    n.fqdn = 'b.example.com'
+    assert n.name == 'FQDN_b.example.com'
+    assert n.cli_attributes() == ' fqdn b.example.com'
+
+    n.type = NetworkObject.ObjectType.RANGE
+    assert n.name == 'RANGE_10.1.1.2-10.1.1.20'
+    assert n.cli_attributes() == ' range 10.1.1.2 10.1.1.20'
+
+    # A name set by the user is kept when the attributes change
+    n.name = 'WEB_RANGE'
+    n.end_ip = '10.1.1.30'
+    assert n.cli_full()[:2] == ['object network WEB_RANGE',
+                                ' range 10.1.1.2 10.1.1.30']
+
+
+def test_network_objects_build_ipv4network_lazily():
+    asa_objects._build_network.cache_clear()
+
+    objects = [
+        NetworkObject(ob_type=NetworkObject.ObjectType.HOST, ip='10.9.0.1'),
+        NetworkObject(ob_type=NetworkObject.ObjectType.NETWORK,
+                      ip='10.9.0.0', netmask='255.255.255.0'),
+        NetworkObject(ob_type=NetworkObject.ObjectType.RANGE,
+                      ip='10.9.0.1', end_ip='10.9.0.9'),
+    ] + NetworkObject.from_strings(['10.9.1.1', '10.9.2.0/24'])
+    for n in objects:
+        str(n)
+
+    assert asa_objects._build_network.cache_info().misses == 0
+    assert str(objects[0].ip) == '10.9.0.1/32'
+
+
+def test_port_range_boundaries():
+    single = TcpObject.PortSelecterType.SINGLE
+    for port in (0, 65535, '80', '65535'):
+        t = TcpObject(dest_port_selecter_type=single, dest_port=port)
+        assert t.dest_port == port
+
+    for port in (-1, 65536, '-1', '65536'):
+        with pytest.raises(ValueError):
+            UdpObject(source_port_selecter_type=single, source_port=port)
+
+
+def test_icmp_range_boundaries():
+    for code in (1, 255, '1', '255'):
+        assert IcmpObject(icmp_type='echo', icmp_code=code).icmp_code == code
+    for code in (0, 256, -1, '256'):
+        with pytest.raises(ValueError):
+            IcmpObject(icmp_type='echo', icmp_code=code)
+
+    # Type 0 is treated as unset, and raises like any invalid type
+    for icmp_type in (1, 255, '255'):
+        assert IcmpObject(icmp_type=icmp_type).icmp_type == icmp_type
+    for icmp_type in (0, 256, -1, '256'):
+        with pytest.raises(ValueError):
+            IcmpObject(icmp_type=icmp_type)
+
+
+def test_parse_stats_counters():
+    asa_objects._parse_ipv4_cached.cache_clear()
+    stats = asa_objects._parse_stats
+    slow_path, rejected = stats['slow_path'], stats['rejected']
+
+    # Hostmask notation takes the slow path, once per distinct spec
+    for _ in range(2):
+        n = NetworkObject(ob_type=NetworkObject.ObjectType.NETWORK,
+                          ip='10.4.0.0/0.0.255.255')
+        assert n.name == 'NET_10.4.0.0_16'
+    assert stats['slow_path'] == slow_path + 1
+
+    # Malformed specs are counted as rejected, every time they are seen
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            NetworkObject(ob_type=NetworkObject.ObjectType.HOST, ip='10.4.0')
+    assert stats['rejected'] == rejected + 2
+    assert stats['slow_path'] == slow_path + 1